@@ -7,20 +7,18 @@ using a structured observability framework with Python best practices.
 """
 import logging
 import argparse
-import random
+import concurrent.futures
+import dataclasses
 import threading
 import time
 from typing import Optional
 
+import numpy as np
+
 from observability import MetricsManager, TracingManager
 from observability.config import ObservabilityConfig
-from observability.metrics import MetricsExamples
+from observability.metrics import CachedAttributes, MetricsExamples
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 
@@ -33,6 +31,11 @@ class ObservabilityDemo:
         self.tracing_manager: Optional[TracingManager] = None
         self.metrics_examples: Optional[MetricsExamples] = None
         self._shutdown_event = threading.Event()
+        self._nprng = np.random.default_rng()
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=4,
+            thread_name_prefix="otel-demo"
+        )
     
     def setup(self) -> None:
         """Initialize observability components."""
@@ -47,7 +50,7 @@ class ObservabilityDemo:
         self.tracing_manager.setup()
         
         # Initialize examples
-        self.metrics_examples = MetricsExamples(self.metrics_manager)
+        self.metrics_examples = MetricsExamples(self.metrics_manager, realtime=self.config.realtime)
         
         logger.info("Observability setup completed")
     
@@ -56,8 +59,9 @@ class ObservabilityDemo:
         logger.info("=== Counter Metrics Demo ===")
         
         with self.tracing_manager.start_span("counter_demo") as span:
-            # Create a counter for demo purposes
-            demo_counter = self.metrics_manager.create_counter(
+            # Create a counter for demo purposes; increments are aggregated
+            # locally and flushed as one add per event type
+            demo_counter = self.metrics_manager.create_batching_counter(
                 "demo_events_total",
                 "Total number of demo events",
                 "1"
@@ -65,13 +69,23 @@ class ObservabilityDemo:
             
             # Simulate events
             events = ["user_login", "user_logout", "page_view", "api_call"]
+            event_attributes = {event: CachedAttributes(event_type=event) for event in events}
+            
+            # Bind hot methods to locals once instead of resolving them per iteration
+            inc = demo_counter.inc
+            realtime = self.config.realtime
+            sleep = time.sleep
+            log_progress = logger.isEnabledFor(logging.INFO)
             
             for i in range(20):
                 event_type = events[i % len(events)]
-                demo_counter.record(1, {"event_type": event_type})
-                logger.info(f"Recorded counter event: {event_type}")
-                time.sleep(0.5)
+                inc(event_attributes[event_type])
+                if log_progress:
+                    logger.info("Recorded counter event: %s", event_type)
+                if realtime:
+                    sleep(0.5)
             
+            demo_counter.flush()
             span.set_attribute("events_generated", 20)
     
     def run_histogram_demo(self) -> None:
@@ -88,23 +102,31 @@ class ObservabilityDemo:
             
             # Simulate operations with varying durations
             operations = ["database_query", "api_call", "file_processing", "calculation"]
+            operation_attributes = {op: CachedAttributes(operation=op) for op in operations}
+            
+            # Different duration patterns (mean, stddev) per operation, drawn in one pass
+            rng = self._nprng
+            duration_mean = np.array([0.1, 0.2, 0.5, 0.05])
+            duration_stddev = np.array([0.05, 0.1, 0.2, 0.02])
+            op_index = np.arange(15) % len(operations)
+            durations = np.maximum(
+                0.01, np.abs(rng.normal(duration_mean[op_index], duration_stddev[op_index]))
+            )
+            
+            record = demo_histogram.fast_record
+            realtime = self.config.realtime
+            sleep = time.sleep
+            log_progress = logger.isEnabledFor(logging.INFO)
             
             for i in range(15):
-                operation = operations[i % len(operations)]
+                operation = operations[op_index[i]]
+                duration = float(durations[i])
                 
-                # Simulate different duration patterns for different operations
-                if operation == "database_query":
-                    duration = max(0.01, abs(random.normalvariate(0.1, 0.05)))
-                elif operation == "api_call":
-                    duration = max(0.01, abs(random.normalvariate(0.2, 0.1)))
-                elif operation == "file_processing":
-                    duration = max(0.01, abs(random.normalvariate(0.5, 0.2)))
-                else:  # calculation
-                    duration = max(0.01, abs(random.normalvariate(0.05, 0.02)))
-                
-                demo_histogram.record(duration, {"operation": operation})
-                logger.info(f"Recorded histogram: {operation} took {duration:.3f}s")
-                time.sleep(0.3)
+                record(duration, operation_attributes[operation])
+                if log_progress:
+                    logger.info("Recorded histogram: %s took %.3fs", operation, duration)
+                if realtime:
+                    sleep(0.3)
             
             span.set_attribute("operations_completed", 15)
     
@@ -126,24 +148,24 @@ class ObservabilityDemo:
                 "hPa"
             )
             
-            # Simulate changing environmental conditions
-            import random
-            base_temp = 20.0
-            base_pressure = 1013.25
+            # Simulate changing environmental conditions as random walks
+            rng = self._nprng
+            temperatures = 20.0 + rng.uniform(-2, 2, 10).cumsum()
+            pressures = 1013.25 + rng.uniform(-5, 5, 10).cumsum()
+            sensor_attributes = {"location": "sensor_1"}
+            log_progress = logger.isEnabledFor(logging.INFO)
             
             for i in range(10):
-                # Simulate temperature fluctuation
-                temp_change = random.uniform(-2, 2)
-                base_temp += temp_change
-                temperature_gauge.record(base_temp, {"location": "sensor_1"})
+                temp = float(temperatures[i])
+                temperature_gauge.record(temp, sensor_attributes)
                 
-                # Simulate pressure fluctuation
-                pressure_change = random.uniform(-5, 5)
-                base_pressure += pressure_change
-                pressure_gauge.record(base_pressure, {"location": "sensor_1"})
+                pressure = float(pressures[i])
+                pressure_gauge.record(pressure, sensor_attributes)
                 
-                logger.info(f"Updated gauges: temp={base_temp:.1f}°C, pressure={base_pressure:.1f}hPa")
-                time.sleep(1)
+                if log_progress:
+                    logger.info("Updated gauges: temp=%.1f°C, pressure=%.1fhPa", temp, pressure)
+                if self.config.realtime:
+                    time.sleep(1)
             
             span.set_attribute("gauge_updates", 10)
     
@@ -159,21 +181,23 @@ class ObservabilityDemo:
                 "1"
             )
             
-            # Simulate resource allocation and deallocation
-            import random
+            # Simulate resource allocation and deallocation:
+            # 60% chance to allocate 1-5 units, 40% chance to release 1-3
+            rng = self._nprng
+            allocate = rng.random(15) > 0.4
+            changes = np.where(allocate, rng.integers(1, 6, 15), -rng.integers(1, 4, 15))
+            resource_attributes = {"resource_type": "compute_units"}
+            log_progress = logger.isEnabledFor(logging.INFO)
             
             for i in range(15):
-                # Randomly allocate or deallocate resources
-                if random.random() > 0.4:  # 60% chance to allocate
-                    change = random.randint(1, 5)
-                    action = "allocated"
-                else:  # 40% chance to deallocate
-                    change = -random.randint(1, 3)
-                    action = "deallocated"
+                change = int(changes[i])
+                action = "allocated" if allocate[i] else "deallocated"
                 
-                demo_updown.record(change, {"resource_type": "compute_units"})
-                logger.info(f"Resource change: {action} {abs(change)} units")
-                time.sleep(0.4)
+                demo_updown.record(change, resource_attributes)
+                if log_progress:
+                    logger.info("Resource change: %s %d units", action, abs(change))
+                if self.config.realtime:
+                    time.sleep(0.4)
             
             span.set_attribute("resource_operations", 15)
     
@@ -182,39 +206,42 @@ class ObservabilityDemo:
         logger.info("=== Comprehensive Metrics Demo ===")
         
         with self.tracing_manager.start_span("comprehensive_demo") as span:
-            # Run web server simulation in a separate thread
-            web_server_thread = threading.Thread(
-                target=self.metrics_examples.simulate_web_server_metrics,
-                args=(20,)
+            # Run web server and system metrics simulations in parallel
+            web_server_future = self._executor.submit(
+                self.metrics_examples.simulate_web_server_metrics, 20
+            )
+            system_future = self._executor.submit(
+                self.metrics_examples.simulate_system_metrics, 25
             )
-            web_server_thread.start()
-            
-            # Run system metrics simulation
-            self.metrics_examples.simulate_system_metrics(duration_seconds=25)
             
-            # Wait for web server simulation to complete
-            web_server_thread.join()
+            # Wait for both simulations and surface any exception they raised
+            for future in (web_server_future, system_future):
+                future.result()
             
             span.set_attribute("demo_type", "comprehensive")
     
     def run_demo(self, demo_type: str = "all") -> None:
         """Run the specified demo type."""
         try:
-            if demo_type == "counter" or demo_type == "all":
-                self.run_counter_demo()
-                time.sleep(2)
-            
-            if demo_type == "histogram" or demo_type == "all":
-                self.run_histogram_demo()
-                time.sleep(2)
-            
-            if demo_type == "gauge" or demo_type == "all":
-                self.run_gauge_demo()
-                time.sleep(2)
+            phases = [
+                phase for name, phase in (
+                    ("counter", self.run_counter_demo),
+                    ("histogram", self.run_histogram_demo),
+                    ("gauge", self.run_gauge_demo),
+                    ("updown", self.run_updown_counter_demo),
+                )
+                if demo_type == name or demo_type == "all"
+            ]
             
-            if demo_type == "updown" or demo_type == "all":
-                self.run_updown_counter_demo()
-                time.sleep(2)
+            if self.config.realtime:
+                # Run phases one after another with a pause in between
+                for phase in phases:
+                    phase()
+                    time.sleep(2)
+            else:
+                # Run phases concurrently and surface any exception they raised
+                for future in [self._executor.submit(phase) for phase in phases]:
+                    future.result()
             
             if demo_type == "comprehensive" or demo_type == "all":
                 self.run_comprehensive_demo()
@@ -224,12 +251,14 @@ class ObservabilityDemo:
         except KeyboardInterrupt:
             logger.info("Demo interrupted by user")
         except Exception as e:
-            logger.exception(f"Error during demo: {e}")
+            logger.exception("Error during demo: %s", e)
     
     def shutdown(self) -> None:
         """Shutdown observability components."""
         logger.info("Shutting down observability components...")
         
+        self._executor.shutdown(wait=True)
+        
         if self.metrics_manager:
             self.metrics_manager.shutdown()
         
@@ -258,14 +287,42 @@ def main():
         default="http://localhost:4317",
         help="OTLP endpoint URL"
     )
+    parser.add_argument(
+        "--realtime",
+        action="store_true",
+        help="Pace demo loops with real sleeps and run demo phases one at a time"
+    )
+    parser.add_argument(
+        "--no-realtime",
+        dest="realtime",
+        action="store_false",
+        help="Record as fast as possible and run demo phases concurrently (default)"
+    )
+    parser.set_defaults(realtime=False)
+    parser.add_argument(
+        "--log-level",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        default="WARNING",
+        help="Logging level (INFO logs every recorded value)"
+    )
     
     args = parser.parse_args()
     
+    # Configure logging
+    logging.basicConfig(
+        level=args.log_level,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     # Create configuration
     config = ObservabilityConfig(
         service_name=args.service_name,
-        otlp_endpoint=args.otlp_endpoint
+        otlp_endpoint=args.otlp_endpoint,
+        realtime=args.realtime
     )
+    if args.realtime:
+        # The paced demos last ~10s, so export often enough to show changes in between
+        config = dataclasses.replace(config, metric_export_interval_millis=5000)
     
     # Create and run demo
     demo = ObservabilityDemo(config)
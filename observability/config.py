@@ -2,22 +2,59 @@
 Configuration module for observability components.
 """
 
-from typing import Dict, Any
+import inspect
+from typing import Any, Dict, Mapping
 from dataclasses import dataclass
+from functools import cached_property
+from types import MappingProxyType
 
-@dataclass
+from grpc import Compression
+
+@dataclass(frozen=True)
 class ObservabilityConfig:
-    """Configuration for observability components."""
+    """Configuration for observability components.
+    
+    The config is immutable, so derived values such as the resource
+    attributes are computed once and cached.
+    """
     
     service_name: str = "python-otel-example"
     service_version: str = "0.1.0"
     environment: str = "development"
     otlp_endpoint: str = "http://localhost:4317"
+    # Gzip OTLP payloads; when off, OTEL_EXPORTER_OTLP_COMPRESSION still applies
+    otlp_gzip: bool = True
+    # gRPC keepalive ping interval (applied with opentelemetry-exporter-otlp 1.35+)
+    otlp_keepalive_time_ms: int = 30000
+    
+    # Pace demo loops with real sleeps instead of recording as fast as possible
+    realtime: bool = False
     
-    def to_resource_attributes(self) -> Dict[str, Any]:
-        """Convert config to OpenTelemetry resource attributes."""
-        return {
+    # Metric export: a longer interval lets the SDK coalesce more points per flush
+    metric_export_interval_millis: int = 30000
+    metric_export_timeout_millis: int = 10000
+    
+    # Span batching
+    span_max_queue_size: int = 4096
+    span_max_export_batch_size: int = 512
+    span_schedule_delay_millis: int = 5000
+    
+    @cached_property
+    def resource_attributes(self) -> Mapping[str, Any]:
+        """OpenTelemetry resource attributes for this config (read-only)."""
+        return MappingProxyType({
             "service.name": self.service_name,
             "service.version": self.service_version,
             "deployment.environment": self.environment,
+        })
+    
+    def otlp_exporter_kwargs(self, exporter_cls: type) -> Dict[str, Any]:
+        """Keyword arguments for an OTLP gRPC exporter class (metrics or spans)."""
+        kwargs: Dict[str, Any] = {
+            "endpoint": self.otlp_endpoint,
+            "compression": Compression.Gzip if self.otlp_gzip else None,
         }
+        # channel_options is only accepted by opentelemetry-exporter-otlp 1.35+
+        if "channel_options" in inspect.signature(exporter_cls.__init__).parameters:
+            kwargs["channel_options"] = (("grpc.keepalive_time_ms", self.otlp_keepalive_time_ms),)
+        return kwargs
@@ -6,11 +6,16 @@ metric types: Counter, Histogram, Gauge, and UpDownCounter.
 """
 
 import logging
+import math
+import random
+import threading
 import time
-from typing import Optional, Dict, Any, Union
-from abc import ABC, abstractmethod
+from typing import Optional, Callable, Dict, Any, List, Mapping, Union
 from enum import Enum
+from functools import partial
+from types import MappingProxyType
 
+import numpy as np
 from opentelemetry import metrics
 from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
 from opentelemetry.sdk.metrics import MeterProvider
@@ -21,6 +26,15 @@ from .config import ObservabilityConfig
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only attributes, and their key, for measurements recorded without attributes
+_EMPTY_ATTRS = MappingProxyType({})
+_EMPTY_KEY = frozenset()
+
+# Attribute values used by the web server simulation
+HTTP_METHODS = ("GET", "POST", "PUT", "DELETE")
+HTTP_STATUSES = ("200", "404", "500")
+HTTP_ENDPOINTS = ("/api/users", "/api/orders", "/api/products")
+
 
 class MetricType(Enum):
     """Enumeration of different metric types."""
@@ -30,24 +44,70 @@ class MetricType(Enum):
     UP_DOWN_COUNTER = "up_down_counter"
 
 
-class BaseMetric(ABC):
-    """Base class for all metric types."""
+class CachedAttributes(dict):
+    """
+    Read-only attribute dict that carries its precomputed frozenset key.
+    
+    Build one per attribute combination up front and reuse it on every
+    record. Only BatchingCounter (and the observable gauge fallback for
+    opentelemetry-api < 1.24) uses ``key`` instead of rebuilding
+    ``frozenset(attributes.items())``; instruments that record straight into
+    the SDK still have the SDK build its own key. Mutating methods raise
+    TypeError so ``key`` can never go stale.
+    """
+    
+    __slots__ = ("key",)
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.key = frozenset(self.items())
+    
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} is read-only")
+    
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    update = pop = popitem = setdefault = clear = _readonly
+
+
+def _attributes_key(attributes: Optional[Mapping[str, Any]]) -> frozenset:
+    """Get the frozenset key for attributes, reusing a precomputed one when available."""
+    if type(attributes) is CachedAttributes:
+        return attributes.key
+    return frozenset(attributes.items()) if attributes else _EMPTY_KEY
+
+
+class BaseMetric:
+    """
+    Base class for all metric types.
+    
+    Subclasses implement ``create_instrument()`` and ``record()``.
+    ``fast_record`` has the same signature as ``record()`` and defaults to it;
+    the built-in metric types rebind it in ``create_instrument()`` to a
+    callable specialised for the created SDK instrument, so hot loops skip
+    the Python-level dispatch and checks.
+    """
+    
+    __slots__ = ("name", "description", "unit", "_instrument", "fast_record")
     
     def __init__(self, name: str, description: str, unit: str = "1"):
         self.name = name
         self.description = description
         self.unit = unit
         self._instrument = None
+        self.fast_record: Callable[..., None] = self.record
     
-    @abstractmethod
     def create_instrument(self, meter: metrics.Meter):
         """Create the OpenTelemetry instrument."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def record(self, value: Union[int, float], attributes: Optional[Dict[str, Any]] = None):
         """Record a value for this metric."""
-        pass
+        raise NotImplementedError
+    
+    def _install_fast_record(self, recorder: Callable[..., None], owner: type) -> None:
+        """Use ``recorder`` as ``fast_record`` unless a subclass of ``owner`` overrides ``record()``."""
+        if type(self).record is owner.record:
+            self.fast_record = recorder
 
 
 class CounterMetric(BaseMetric):
@@ -59,8 +119,19 @@ class CounterMetric(BaseMetric):
     - Error counts
     - Task completion counts
     - Events processed
+    
+    ``record()`` validates that values are non-negative. ``inc(attributes)``
+    is the unvalidated fast path that adds one; ``attributes`` must be a
+    mapping (not None).
     """
     
+    __slots__ = ("inc",)
+    
+    def __init__(self, name: str, description: str, unit: str = "1"):
+        super().__init__(name, description, unit)
+        # Goes through record() until the instrument exists
+        self.inc: Callable[..., None] = partial(self.record, 1)
+    
     def create_instrument(self, meter: metrics.Meter):
         """Create a counter instrument."""
         self._instrument = meter.create_counter(
@@ -68,7 +139,8 @@ class CounterMetric(BaseMetric):
             description=self.description,
             unit=self.unit
         )
-        logger.debug(f"Created counter metric: {self.name}")
+        self.inc = partial(self._instrument.add, 1)
+        logger.debug("Created counter metric: %s", self.name)
     
     def record(self, value: Union[int, float], attributes: Optional[Dict[str, Any]] = None):
         """Add to the counter value."""
@@ -78,7 +150,67 @@ class CounterMetric(BaseMetric):
         if value < 0:
             raise ValueError("Counter values must be non-negative")
         
-        self._instrument.add(value, attributes=attributes or {})
+        self._instrument.add(value, attributes=attributes or _EMPTY_ATTRS)
+
+
+class BatchingCounter:
+    """
+    Counter wrapper that pre-aggregates increments locally.
+    
+    Increments are summed per attribute set in a plain dict and forwarded to
+    the underlying counter as a single ``add`` per attribute set on ``flush()``,
+    instead of one SDK call per event. A flush also happens automatically once
+    ``flush_every`` increments have been buffered.
+    """
+    
+    __slots__ = ("counter", "flush_every", "_pending", "_pending_count", "_lock")
+    
+    def __init__(self, counter: CounterMetric, flush_every: int = 1000):
+        self.counter = counter
+        self.flush_every = flush_every
+        self._pending: Dict[frozenset, List[Any]] = {}
+        self._pending_count = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def name(self) -> str:
+        """Name of the wrapped counter."""
+        return self.counter.name
+    
+    def record(self, value: Union[int, float], attributes: Optional[Dict[str, Any]] = None):
+        """Buffer an increment for the given attribute set."""
+        if value < 0:
+            raise ValueError("Counter values must be non-negative")
+        
+        self._add(value, attributes or _EMPTY_ATTRS)
+    
+    def inc(self, attributes: Mapping[str, Any] = _EMPTY_ATTRS):
+        """Buffer an increment of one without validation; ``attributes`` must not be None."""
+        self._add(1, attributes)
+    
+    def _add(self, value: Union[int, float], attributes: Mapping[str, Any]) -> None:
+        """Add a value to the buffered total for the attribute set."""
+        key = _attributes_key(attributes)
+        with self._lock:
+            entry = self._pending.get(key)
+            if entry is None:
+                self._pending[key] = [attributes, value]
+            else:
+                entry[1] += value
+            self._pending_count += 1
+            should_flush = self._pending_count >= self.flush_every
+        
+        if should_flush:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Forward buffered totals to the wrapped counter."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._pending_count = 0
+        
+        for attributes, total in pending.values():
+            self.counter.record(total, attributes)
 
 
 class HistogramMetric(BaseMetric):
@@ -92,6 +224,8 @@ class HistogramMetric(BaseMetric):
     - Processing time
     """
     
+    __slots__ = ()
+    
     def create_instrument(self, meter: metrics.Meter):
         """Create a histogram instrument."""
         self._instrument = meter.create_histogram(
@@ -99,14 +233,15 @@ class HistogramMetric(BaseMetric):
             description=self.description,
             unit=self.unit
         )
-        logger.debug(f"Created histogram metric: {self.name}")
+        self._install_fast_record(self._instrument.record, HistogramMetric)
+        logger.debug("Created histogram metric: %s", self.name)
     
     def record(self, value: Union[int, float], attributes: Optional[Dict[str, Any]] = None):
         """Record a value in the histogram."""
         if self._instrument is None:
             raise RuntimeError(f"Instrument not created for metric {self.name}")
         
-        self._instrument.record(value, attributes=attributes or {})
+        self._instrument.record(value, attributes=attributes or _EMPTY_ATTRS)
 
 
 class GaugeMetric(BaseMetric):
@@ -121,26 +256,98 @@ class GaugeMetric(BaseMetric):
     - Queue size
     """
     
+    __slots__ = (
+        "_current_value",
+        "_recorder",
+        "_obs_values",
+        "_obs_index",
+        "_observations",
+        "_obs_lock",
+    )
+    
     def __init__(self, name: str, description: str, unit: str = "1"):
         super().__init__(name, description, unit)
         self._current_value = 0.0
+        # Observable-gauge state: last value per attribute set, and a pooled list
+        # of Observations returned as-is from the callback
+        self._obs_values: Dict[frozenset, List[Any]] = {}
+        self._obs_index: Dict[frozenset, int] = {}
+        self._observations: List[metrics.Observation] = []
+        self._obs_lock = threading.Lock()
+        # Values recorded before the instrument exists are kept for the fallback
+        self._recorder: Callable[..., None] = self._record_observed
+        self._install_fast_record(self._recorder, GaugeMetric)
     
     def create_instrument(self, meter: metrics.Meter):
-        """Create a gauge instrument using observable gauge."""
-        def get_current_value(options):
-            return [metrics.Observation(self._current_value)]
+        """
+        Create a gauge instrument.
+        
+        Uses the synchronous gauge (opentelemetry-api 1.24+), which keeps the
+        last value in the SDK and needs no collection callback. Older APIs fall
+        back to an observable gauge reporting the last recorded value.
+        """
+        if hasattr(meter, "create_gauge"):
+            self._instrument = meter.create_gauge(
+                name=self.name,
+                description=self.description,
+                unit=self.unit
+            )
+            set_value = self._instrument.set
+            
+            def record(value: Union[int, float], attributes: Optional[Dict[str, Any]] = None):
+                value = value if type(value) is float else float(value)
+                self._current_value = value
+                set_value(value, attributes)
+            
+            self._recorder = record
+            self._install_fast_record(record, GaugeMetric)
+            logger.debug("Created gauge metric: %s", self.name)
+            return
         
         self._instrument = meter.create_observable_gauge(
             name=self.name,
             description=self.description,
             unit=self.unit,
-            callbacks=[get_current_value]
+            callbacks=[self._observe]
         )
-        logger.debug(f"Created gauge metric: {self.name}")
+        logger.debug("Created observable gauge metric: %s", self.name)
     
     def record(self, value: Union[int, float], attributes: Optional[Dict[str, Any]] = None):
         """Set the gauge value."""
-        self._current_value = float(value)
+        self._recorder(value, attributes)
+    
+    def _record_observed(self, value: Union[int, float], attributes: Optional[Dict[str, Any]] = None):
+        """Set the gauge value reported by the observable callback."""
+        value = value if type(value) is float else float(value)
+        self._current_value = value
+        
+        key = _attributes_key(attributes)
+        entry = self._obs_values.get(key)
+        if entry is not None:
+            entry[1] = value
+            return
+        
+        with self._obs_lock:
+            self._obs_values[key] = [attributes or _EMPTY_ATTRS, value]
+    
+    def _observe(self, options) -> List[metrics.Observation]:
+        """
+        Observable gauge callback.
+        
+        Returns the same pooled list on every collection. Observation is
+        immutable, so an entry is only rebuilt when its value has changed and a
+        scrape with no changes allocates nothing.
+        """
+        observations = self._observations
+        with self._obs_lock:
+            for key, (attributes, value) in self._obs_values.items():
+                index = self._obs_index.get(key)
+                if index is None:
+                    self._obs_index[key] = len(observations)
+                    observations.append(metrics.Observation(value, attributes))
+                elif observations[index].value != value:
+                    observations[index] = metrics.Observation(value, attributes)
+        return observations
     
     def get_value(self) -> float:
         """Get the current gauge value."""
@@ -158,6 +365,8 @@ class UpDownCounterMetric(BaseMetric):
     - Cache size
     """
     
+    __slots__ = ()
+    
     def create_instrument(self, meter: metrics.Meter):
         """Create an up-down counter instrument."""
         self._instrument = meter.create_up_down_counter(
@@ -165,14 +374,16 @@ class UpDownCounterMetric(BaseMetric):
             description=self.description,
             unit=self.unit
         )
-        logger.debug(f"Created up-down counter metric: {self.name}")
+        # Values can be negative, so fast_record binds straight to the SDK's add
+        self._install_fast_record(self._instrument.add, UpDownCounterMetric)
+        logger.debug("Created up-down counter metric: %s", self.name)
     
     def record(self, value: Union[int, float], attributes: Optional[Dict[str, Any]] = None):
         """Add to the up-down counter (can be negative)."""
         if self._instrument is None:
             raise RuntimeError(f"Instrument not created for metric {self.name}")
         
-        self._instrument.add(value, attributes=attributes or {})
+        self._instrument.add(value, attributes=attributes or _EMPTY_ATTRS)
 
 
 class MetricsManager:
@@ -184,15 +395,18 @@ class MetricsManager:
         self._meter_provider: Optional[MeterProvider] = None
         self._meter: Optional[metrics.Meter] = None
         self._metrics: Dict[str, BaseMetric] = {}
+        self._batching_counters: List[BatchingCounter] = []
     
     def setup(self) -> None:
         """Setup the meter provider and configure metrics."""
-        resource = Resource(attributes=self.config.to_resource_attributes())
+        resource = Resource(attributes=self.config.resource_attributes)
         
         # Create a meter provider
+        exporter = OTLPMetricExporter(**self.config.otlp_exporter_kwargs(OTLPMetricExporter))
         metric_reader = PeriodicExportingMetricReader(
-            OTLPMetricExporter(endpoint=self.config.otlp_endpoint),
-            export_interval_millis=5000  # Export every 5 seconds
+            exporter,
+            export_interval_millis=self.config.metric_export_interval_millis,
+            export_timeout_millis=self.config.metric_export_timeout_millis
         )
         self._meter_provider = MeterProvider(
             resource=resource, 
@@ -220,6 +434,14 @@ class MetricsManager:
         self._metrics[name] = metric
         return metric
     
+    def create_batching_counter(
+        self, name: str, description: str, unit: str = "1", flush_every: int = 1000
+    ) -> BatchingCounter:
+        """Create a counter whose increments are pre-aggregated before recording."""
+        batching_counter = BatchingCounter(self.create_counter(name, description, unit), flush_every)
+        self._batching_counters.append(batching_counter)
+        return batching_counter
+    
     def create_histogram(self, name: str, description: str, unit: str = "1") -> HistogramMetric:
         """Create and register a histogram metric."""
         metric = HistogramMetric(name, description, unit)
@@ -250,7 +472,10 @@ class MetricsManager:
         return self._metrics.copy()
     
     def shutdown(self) -> None:
-        """Shutdown the meter provider."""
+        """Flush pending batched values and shutdown the meter provider."""
+        for batching_counter in self._batching_counters:
+            batching_counter.flush()
+        
         if self._meter_provider:
             self._meter_provider.shutdown()
             logger.info("Metrics shutdown completed")
@@ -259,8 +484,28 @@ class MetricsManager:
 class MetricsExamples:
     """Examples demonstrating different metric types in real-world scenarios."""
     
-    def __init__(self, metrics_manager: MetricsManager):
+    __slots__ = (
+        "metrics_manager",
+        "realtime",
+        "request_counter",
+        "error_counter",
+        "request_duration",
+        "task_processing_time",
+        "memory_usage",
+        "cpu_usage",
+        "active_connections",
+        "queue_size",
+        "_req_attr_cache",
+        "_error_attrs",
+        "_rng",
+        "_nprng",
+    )
+    
+    def __init__(self, metrics_manager: MetricsManager, realtime: bool = False):
         self.metrics_manager = metrics_manager
+        self.realtime = realtime
+        self._rng = random.Random()
+        self._nprng = np.random.default_rng()
         self._setup_example_metrics()
     
     def _setup_example_metrics(self):
@@ -316,66 +561,98 @@ class MetricsExamples:
             "Number of items in processing queue",
             "1"
         )
+        
+        # Attribute dicts (with their frozenset keys) are built once per
+        # combination and reused on every record
+        self._req_attr_cache = {
+            (method, status, endpoint): CachedAttributes(method=method, status=status, endpoint=endpoint)
+            for method in HTTP_METHODS
+            for status in HTTP_STATUSES
+            for endpoint in HTTP_ENDPOINTS
+        }
+        self._error_attrs = CachedAttributes(error_type="timeout", service="database")
     
     def simulate_web_server_metrics(self, num_requests: int = 10):
         """Simulate web server metrics."""
-        logger.info(f"Simulating {num_requests} web server requests")
+        logger.info("Simulating %d web server requests", num_requests)
+        
+        # Draw every random choice for the whole run up front
+        rng = self._nprng
+        method_idx = rng.integers(0, len(HTTP_METHODS), num_requests).tolist()
+        status_idx = rng.integers(0, len(HTTP_STATUSES), num_requests).tolist()
+        endpoint_idx = rng.integers(0, len(HTTP_ENDPOINTS), num_requests).tolist()
+        processing_times = rng.uniform(0.1, 2.0, num_requests).tolist()
+        error_mask = rng.random(num_requests) < 0.1  # 10% error rate
+        
+        # Bind hot methods to locals once instead of resolving them per iteration
+        inc_request = self.request_counter.inc
+        record_duration = self.request_duration.fast_record
+        attr_cache = self._req_attr_cache
+        realtime = self.realtime
+        sleep = time.sleep
+        log_progress = logger.isEnabledFor(logging.INFO)
         
         for i in range(num_requests):
-            # Simulate request processing
-            start_time = time.time()
-            
-            # Simulate processing time (0.1 to 2.0 seconds)
-            import random
-            processing_time = random.uniform(0.1, 2.0)
-            time.sleep(processing_time)
+            # Simulated processing time (0.1 to 2.0 seconds), only waited out in realtime mode
+            processing_time = processing_times[i]
+            if realtime:
+                sleep(processing_time)
             
             # Record metrics
-            attributes = {
-                "method": random.choice(["GET", "POST", "PUT", "DELETE"]),
-                "status": random.choice(["200", "404", "500"]),
-                "endpoint": random.choice(["/api/users", "/api/orders", "/api/products"])
-            }
+            attributes = attr_cache[(
+                HTTP_METHODS[method_idx[i]],
+                HTTP_STATUSES[status_idx[i]],
+                HTTP_ENDPOINTS[endpoint_idx[i]]
+            )]
             
             # Counter: increment request count
-            self.request_counter.record(1, attributes)
+            inc_request(attributes)
             
             # Histogram: record request duration
-            self.request_duration.record(processing_time, attributes)
-            
-            # Simulate errors (10% chance)
-            if random.random() < 0.1:
-                error_attributes = {"error_type": "timeout", "service": "database"}
-                self.error_counter.record(1, error_attributes)
+            record_duration(processing_time, attributes)
             
-            logger.info(f"Processed request {i+1}/{num_requests} in {processing_time:.2f}s")
+            if log_progress:
+                logger.info("Processed request %d/%d in %.2fs", i + 1, num_requests, processing_time)
+        
+        # Simulated errors are recorded as a single batched add
+        error_total = int(error_mask.sum())
+        if error_total:
+            self.error_counter.record(error_total, self._error_attrs)
     
     def simulate_system_metrics(self, duration_seconds: int = 30):
         """Simulate system resource metrics."""
-        logger.info(f"Simulating system metrics for {duration_seconds} seconds")
+        logger.info("Simulating system metrics for %d seconds", duration_seconds)
         
-        import random
-        start_time = time.time()
+        record_memory = self.memory_usage.fast_record
+        record_cpu = self.cpu_usage.fast_record
+        record_connections = self.active_connections.fast_record
+        record_queue = self.queue_size.fast_record
+        rand_choice = self._rng.choice
+        rand_uniform = self._rng.uniform
+        realtime = self.realtime
+        sleep = time.sleep
         
-        while time.time() - start_time < duration_seconds:
+        # One update per 2 seconds of simulated time
+        for _ in range(math.ceil(duration_seconds / 2)):
             # Simulate changing system metrics
             
             # Gauge: memory usage (simulate between 1GB and 4GB)
-            memory_bytes = random.uniform(1_000_000_000, 4_000_000_000)
-            self.memory_usage.record(memory_bytes)
+            memory_bytes = rand_uniform(1_000_000_000, 4_000_000_000)
+            record_memory(memory_bytes)
             
             # Gauge: CPU usage (simulate between 10% and 90%)
-            cpu_percent = random.uniform(10, 90)
-            self.cpu_usage.record(cpu_percent)
+            cpu_percent = rand_uniform(10, 90)
+            record_cpu(cpu_percent)
             
             # UpDownCounter: simulate connections coming and going
-            connection_change = random.choice([-2, -1, 0, 1, 2, 3])
-            self.active_connections.record(connection_change)
+            connection_change = rand_choice([-2, -1, 0, 1, 2, 3])
+            record_connections(connection_change)
             
             # UpDownCounter: simulate queue size changes
-            queue_change = random.choice([-3, -2, -1, 0, 1, 2, 3, 4])
-            self.queue_size.record(queue_change)
+            queue_change = rand_choice([-3, -2, -1, 0, 1, 2, 3, 4])
+            record_queue(queue_change)
             
-            time.sleep(2)  # Update every 2 seconds
+            if realtime:
+                sleep(2)  # Update every 2 seconds
             
         logger.info("System metrics simulation completed")
@@ -28,14 +28,19 @@ class TracingManager:
     
     def setup(self) -> None:
         """Setup the tracer provider and configure tracing."""
-        resource = Resource(attributes=self.config.to_resource_attributes())
+        resource = Resource(attributes=self.config.resource_attributes)
         
         # Create a tracer provider
         self._tracer_provider = TracerProvider(resource=resource)
         
         # Create an OTLP exporter and add it to the tracer provider
-        otlp_exporter = OTLPSpanExporter(endpoint=self.config.otlp_endpoint)
-        span_processor = BatchSpanProcessor(otlp_exporter)
+        otlp_exporter = OTLPSpanExporter(**self.config.otlp_exporter_kwargs(OTLPSpanExporter))
+        span_processor = BatchSpanProcessor(
+            otlp_exporter,
+            max_queue_size=self.config.span_max_queue_size,
+            schedule_delay_millis=self.config.span_schedule_delay_millis,
+            max_export_batch_size=self.config.span_max_export_batch_size
+        )
         self._tracer_provider.add_span_processor(span_processor)
         
         # Set the tracer provider